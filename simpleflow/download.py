@@ -9,6 +9,10 @@ from simpleflow import logger
 from simpleflow.settings import SIMPLEFLOW_BINARIES_DIRECTORY
 from simpleflow.storage import pull
 
+# binaries already downloaded or checked by this process: if they're still
+# there, we can skip the makedirs() and the file lock on later calls
+DOWNLOADED_BINARIES = set()
+
 
 class RemoteBinary(object):
     """
@@ -34,10 +38,13 @@ class RemoteBinary(object):
         self.lock_location = self._compute_lock_location()
 
     def download(self):
+        if self.local_location in DOWNLOADED_BINARIES and self._check_binary_present():
+            return
         self._mkdir_p(self.local_directory)
         with FileLock(self.lock_location):
             if not self._check_binary_present():
                 self._download_binary()
+        DOWNLOADED_BINARIES.add(self.local_location)
 
     def _mkdir_p(self, path):
         try:
@@ -74,7 +81,10 @@ def download_binaries(binaries_map):
     for binary, remote_location in binaries_map.items():
         binary = RemoteBinary(binary, remote_location)
         binary.download()
-        os.environ["PATH"] = binary.local_directory + ":" + os.environ["PATH"]
+        # move (rather than add) the directory to the front of $PATH, so the
+        # requested version wins without growing $PATH on each call
+        parts = [p for p in os.environ["PATH"].split(":") if p != binary.local_directory]
+        os.environ["PATH"] = ":".join([binary.local_directory] + parts)
 
 
 def with_binaries(binaries_map):
@@ -3,7 +3,7 @@ import json
 import os
 import re
 import time
-from collections import OrderedDict
+from collections import OrderedDict, defaultdict
 try:
     from urllib.parse import quote_plus  # py 3.x
 except ImportError:
@@ -160,16 +160,23 @@ class MetrologyWorkflow(Workflow):
         history_dumped = dump_history_to_json(history)
         history = json.loads(history_dumped)
 
+        # index history entries by name once instead of scanning the whole
+        # history for each activity key
+        history_by_name = defaultdict(list)
+        for h in history:
+            history_by_name[h[0]].append(h[1])
+
         for key in activity_keys:
             if not key.key.startswith(os.path.join(self.metrology_path, 'activity.')):
                 continue
-            contents = key.get_contents_as_string(encoding='utf-8')
-            result = json.loads(contents)
             search = ACTIVITY_KEY_RE.search(key.name)
             name = search.group(1)
-            for h in history:
-                if h[0] == name:
-                    h[1]["metrology"] = result
+            if name not in history_by_name:
+                continue
+            contents = key.get_contents_as_string(encoding='utf-8')
+            result = json.loads(contents)
+            for entry in history_by_name[name]:
+                entry["metrology"] = result
 
         storage.push_content(
             settings.METROLOGY_BUCKET,
@@ -13,16 +13,25 @@ if TYPE_CHECKING:
 
 BUCKET_CACHE = {}
 BUCKET_LOCATIONS_CACHE = {}
+CONNECTIONS_CACHE = {}
 
 
 def get_connection(host_or_region):
     # type: (str) -> connection.S3Connection
+    # reuse connections so that buckets living in the same region share
+    # boto's HTTP connection pool (and its keep-alive'd sockets)
+    if host_or_region in CONNECTIONS_CACHE:
+        return CONNECTIONS_CACHE[host_or_region]
+
     # first case: we got a valid DNS (host)
     if "." in host_or_region:
-        return connection.S3Connection(host=host_or_region)
-
+        conn = connection.S3Connection(host=host_or_region)
     # second case: we got a region
-    return connect_to_region(host_or_region)
+    else:
+        conn = connect_to_region(host_or_region)
+
+    CONNECTIONS_CACHE[host_or_region] = conn
+    return conn
 
 
 def sanitize_bucket_and_host(bucket):
@@ -76,8 +85,8 @@ def sanitize_bucket_and_host(bucket):
 def get_bucket(bucket_name):
     # type: (str) -> Bucket
     bucket_name, location = sanitize_bucket_and_host(bucket_name)
-    conn = get_connection(location)
     if bucket_name not in BUCKET_CACHE:
+        conn = get_connection(location)
         bucket = conn.get_bucket(bucket_name, validate=False)
         BUCKET_CACHE[bucket_name] = bucket
     return BUCKET_CACHE[bucket_name]
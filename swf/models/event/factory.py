@@ -102,16 +102,24 @@ class EventFactory(object):
     # eventType to Event subclass bindings
     events = EVENTS
 
+    # eventType to (event type, event state, attributes key): these only
+    # depend on the event name, no need to recompute them for each event
+    _parsed_event_names = {}
+
     def __new__(klass, raw_event):
         event_id = raw_event['eventId']
         event_name = raw_event['eventType']
         event_timestamp = raw_event['eventTimestamp']
 
-        event_type = klass._extract_event_type(event_name)
-        event_state = klass._extract_event_state(event_type, event_name)
-        # amazon swf format is not very normalized and event attributes
-        # response field is non-capitalized...
-        event_attributes_key = decapitalize(event_name) + 'EventAttributes'
+        if event_name not in klass._parsed_event_names:
+            event_type = klass._extract_event_type(event_name)
+            event_state = klass._extract_event_state(event_type, event_name)
+            # amazon swf format is not very normalized and event attributes
+            # response field is non-capitalized...
+            event_attributes_key = decapitalize(event_name) + 'EventAttributes'
+            klass._parsed_event_names[event_name] = (event_type, event_state, event_attributes_key)
+
+        event_type, event_state, event_attributes_key = klass._parsed_event_names[event_name]
 
         klass = EventFactory.events[event_type]['event']
         klass._name = event_name
@@ -5,6 +5,7 @@
 #
 # See the file LICENSE for copying permission.
 
+import re
 from datetime import datetime, timedelta
 from time import mktime
 from itertools import chain, islice
@@ -172,18 +173,29 @@ def immutable(mutableclass):
     return immutableclass
 
 
+# camel_to_underscore() is called on every attribute of every history event,
+# but only ever sees the (small) SWF vocabulary: memoize it
+_CAMEL_TO_UNDERSCORE_CACHE = {}
+_UPPER_NOT_FIRST_RE = re.compile(r'(?!^)([A-Z])')
+
+
 def camel_to_underscore(string):
     """Translates amazon Camelcased strings to
-    lowercased underscored strings"""
-    res = []
+    lowercased underscored strings
 
-    for index, char in enumerate(string):
-        if index != 0 and char.isupper():
-            res.extend(['_', char.lower()])
-        else:
-            res.extend([char.lower()])
+    >>> camel_to_underscore('')
+    ''
+    >>> camel_to_underscore('activityId')
+    'activity_id'
+    >>> camel_to_underscore('StartToCloseTimeout')
+    'start_to_close_timeout'
+    """
+    if string in _CAMEL_TO_UNDERSCORE_CACHE:
+        return _CAMEL_TO_UNDERSCORE_CACHE[string]
 
-    return ''.join(res)
+    result = _UPPER_NOT_FIRST_RE.sub(r'_\1', string).lower()
+    _CAMEL_TO_UNDERSCORE_CACHE[string] = result
+    return result
 
 
 def underscore_to_camel(string):
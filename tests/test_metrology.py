@@ -64,6 +64,27 @@ class MetrologyTestCase(unittest.TestCase):
         self.assertEqual(res[0][1]["metrology"]["steps"][0]["read"]["records"], 1)
         self.assertEqual(res[0][1]["metrology"]["steps"][0]["metadata"]["num"], 1)
 
+    @mock_s3
+    def test_metrology_ignores_orphan_activity_keys(self):
+        self.create_bucket()
+        # no "orphan" activity in the history: this key must never be read
+        # (it's not valid JSON, so parsing it would raise)
+        storage.push_content(
+            settings.METROLOGY_BUCKET,
+            "local/local/activity.orphan.json",
+            "not json")
+        ex = Executor(MyWorkflow)
+        ex.run(input={"args": [1], "kwargs": {}})
+
+        activity = json.loads(storage.pull_content(
+            settings.METROLOGY_BUCKET,
+            "local/local/activity.0.json"))
+        res = json.loads(storage.pull_content(
+            settings.METROLOGY_BUCKET,
+            "local/local/metrology.json"))
+        self.assertEqual([h[0] for h in res], ["0"])
+        self.assertEqual(res[0][1]["metrology"], activity)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -4,7 +4,7 @@ from mock import patch
 import shutil
 from sure import expect
 
-from simpleflow.download import RemoteBinary, with_binaries
+from simpleflow.download import DOWNLOADED_BINARIES, RemoteBinary, with_binaries
 
 
 # example binary remote/local location
@@ -29,6 +29,7 @@ class TestRemoteBinary(unittest.TestCase):
 
     def _cleanup(self):
         shutil.rmtree(local_directory, ignore_errors=True)
+        DOWNLOADED_BINARIES.clear()
 
     def test_locations_computing(self):
         binary = RemoteBinary("custom-bin", remote_location)
@@ -52,8 +53,35 @@ class TestRemoteBinary(unittest.TestCase):
         binary.download()
         method_mock.assert_called_once_with()
 
+    @patch("simpleflow.download.FileLock")
+    def test_should_lock_only_once_if_binary_present(self, lock_mock):
+        binary = RemoteBinary("custom-bin", remote_location)
+        fake_download_binary(binary)
+
+        binary.download()
+        RemoteBinary("custom-bin", remote_location).download()
+        expect(lock_mock.call_count).to.equal(1)
+
+    @patch("simpleflow.download.RemoteBinary._download_binary")
+    def test_should_download_again_if_binary_removed(self, method_mock):
+        binary = RemoteBinary("custom-bin", remote_location)
+        fake_download_binary(binary)
+        binary.download()
+
+        # binary removed behind our back (e.g. /tmp cleanup): download it again
+        os.remove(binary.local_location)
+        binary.download()
+        method_mock.assert_called_once_with()
+
 
 class TestWithBinariesDecorator(unittest.TestCase):
+    def setUp(self):
+        DOWNLOADED_BINARIES.clear()
+        self._path = os.environ["PATH"]
+
+    def tearDown(self):
+        os.environ["PATH"] = self._path
+
     @with_binaries({ "custom-bin": remote_location })
     def method_needing_custom_binary(self):
         return "foo!"
@@ -64,3 +92,12 @@ class TestWithBinariesDecorator(unittest.TestCase):
         expect(res).to.equal("foo!")
 
         method_mock.assert_called_once_with()
+
+        # another binaries directory gets prepended in between (e.g. another
+        # version of the same binary): calling it again must move our directory
+        # back to the front of $PATH, without adding it twice
+        os.environ["PATH"] = "/tmp/simpleflow-binaries/other-dir:" + os.environ["PATH"]
+        self.method_needing_custom_binary()
+        path = os.environ["PATH"].split(":")
+        expect(path.count(local_directory)).to.equal(1)
+        expect(path[0]).to.equal(local_directory)
@@ -25,14 +25,22 @@ class TestGroup(unittest.TestCase):
         self.conn = boto.connect_s3()
         self.conn.create_bucket(self.bucket)
 
-    def setUp(self):
-        self.tmp_filename = tempfile.mktemp()
-        f = open(self.tmp_filename, "w")
+    # the source file is only ever read: create it once for the whole class
+    @classmethod
+    def setUpClass(cls):
+        cls.tmp_filename = tempfile.mktemp()
+        f = open(cls.tmp_filename, "w")
         f.write("42")
         f.close()
 
-    def tearDown(self):
-        os.remove(self.tmp_filename)
+    @classmethod
+    def tearDownClass(cls):
+        os.remove(cls.tmp_filename)
+
+    def setUp(self):
+        # don't reuse connections/buckets created under another test's mock
+        storage.CONNECTIONS_CACHE.clear()
+        storage.BUCKET_CACHE.clear()
 
     @mock_s3
     def test_push_file(self):
@@ -112,3 +120,18 @@ class TestGroup(unittest.TestCase):
         # bucket with too many "/": raise
         with self.assertRaises(ValueError):
             storage.sanitize_bucket_and_host('s3-eu-west-1.amazonaws.com/mybucket/subpath')
+
+    @mock_s3
+    def test_get_connection_is_reused(self):
+        conn = storage.get_connection("us-east-1")
+        self.assertIs(storage.get_connection("us-east-1"), conn)
+        self.assertIsNot(storage.get_connection("s3.amazonaws.com"), conn)
+
+    @mock_s3
+    def test_get_bucket_shares_connection_within_region(self):
+        self.create()
+        self.conn.create_bucket("other-bucket")
+        b1 = storage.get_bucket(self.bucket)
+        b2 = storage.get_bucket("other-bucket")
+        self.assertIsNot(b1, b2)
+        self.assertIs(b1.connection, b2.connection)
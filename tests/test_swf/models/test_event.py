@@ -38,9 +38,11 @@ class TestEvent(unittest.TestCase):
 
 class TestHistory(unittest.TestCase):
 
-    def setUp(self):
-        self.event_list = mock_get_workflow_execution_history()
-        self.history = History.from_event_list(self.event_list['events'])
+    # the history is only read by these tests: build it once
+    @classmethod
+    def setUpClass(cls):
+        cls.event_list = mock_get_workflow_execution_history()
+        cls.history = History.from_event_list(cls.event_list['events'])
 
     def tearDown(self):
         pass